@@ -1,63 +1,224 @@
-# ...existing code...
 import os
-import tomli
+try:
+    # Python 3.11+ ships the same parser in the standard library
+    import tomllib as tomli
+except ModuleNotFoundError:
+    import tomli
 import shutil
 import re
+import functools
+import mmap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import json
-from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
+import time
+import logging
+import argparse
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, ModuleLoader
 
-def read_template(template_path):
-    """Read HTML template from file"""
-    try:
-        with open(template_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except FileNotFoundError:
-        raise FileNotFoundError(
-            f"Template file not found at {template_path}. "
-            "Please ensure the template exists."
+logger = logging.getLogger(__name__)
+
+# Directory holding ahead-of-time compiled templates (next to templates/)
+_COMPILED_DIR_NAME = 'templates_compiled'
+
+# Sidecar index-entry caches live outside the output tree (which gets
+# deployed wholesale), keyed by output name so distinct builds don't collide
+_CACHE_ROOT = Path('.index_cache')
+
+def _cache_dir(output_path):
+    return _CACHE_ROOT / output_path.name
+
+# Precompiled patterns for TOML comment scanning (compiled once at import time)
+# Match: key = value # [unit] description
+# Anchored with negated character classes so non-matching lines fail without
+# backtracking; a bytes pattern so the scan can run over an mmap without a
+# full-file decode
+_KV_COMMENT_RE = re.compile(rb'^[ \t]*(\w+)[ \t]*=[ \t]*([^#\n]+?)[ \t]*#[ \t]*(.+)$', re.MULTILINE)
+# Match: [unit] description
+_UNIT_RE = re.compile(r'\[(.+?)\]\s*(.*)')
+# Comparison operators in check formulas, longest alternatives first so
+# '>=' wins over '>'
+_OP_RE = re.compile(r'(>=|<=|==|!=|>|<)')
+
+def compile_templates(templates_dir, target_dir=None):
+    """Ahead-of-time compile the Jinja templates to Python modules
+
+    Run once (``--compile-templates``) after editing templates; subsequent
+    builds load the compiled modules through ModuleLoader and skip template
+    parsing entirely.
+    """
+    templates_path = Path(templates_dir)
+    target = Path(target_dir) if target_dir else templates_path.parent / _COMPILED_DIR_NAME
+    env = Environment(
+        loader=FileSystemLoader(str(templates_path)),
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+    target.mkdir(parents=True, exist_ok=True)
+    # Only the HTML templates are compilable (static/ assets live alongside them)
+    env.compile_templates(str(target), zip=None,
+                          filter_func=lambda name: name.endswith('.html'))
+    return target
+
+def _compiled_templates_fresh(templates_path, compiled_path):
+    """True when every compiled module is newer than every template source"""
+    if not compiled_path.is_dir():
+        return False
+    compiled_mtimes = [p.stat().st_mtime for p in compiled_path.iterdir() if p.suffix == '.py']
+    template_mtimes = [p.stat().st_mtime for p in templates_path.glob('*.html')]
+    if not compiled_mtimes or not template_mtimes:
+        return False
+    return min(compiled_mtimes) >= max(template_mtimes)
+
+@functools.lru_cache(maxsize=1)
+def _get_env(templates_dir):
+    """Build the Jinja2 environment once per templates directory
+
+    Prefers ahead-of-time compiled template modules (see compile_templates)
+    when they are present and up to date, so get_template is an import
+    rather than a parse+compile. Otherwise falls back to loading from the
+    templates directory, where the bytecode cache still lets warm starts
+    skip recompilation. Cached so repeated invocations reuse the
+    environment and its already compiled templates.
+    """
+    templates_path = Path(templates_dir)
+    compiled_path = templates_path.parent / _COMPILED_DIR_NAME
+    if _compiled_templates_fresh(templates_path, compiled_path):
+        return Environment(
+            loader=ModuleLoader(str(compiled_path)),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False
         )
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache()
+    )
 
-def parse_toml_comments(toml_path):
-    """Extract unit and description from TOML comments"""
-    comments = {}
+def _fast_copy(src, dst):
+    """Copy src to dst without moving bytes when avoidable
+
+    Skips the copy entirely when dst is already up to date, and prefers a
+    hardlink (a metadata-only operation) over a byte-for-byte copy; falls
+    back to shutil.copy2 when src and dst are on different filesystems.
+    """
+    if dst.exists():
+        if dst.stat().st_mtime >= src.stat().st_mtime:
+            return
+        # Another worker may have already unlinked the stale copy
+        dst.unlink(missing_ok=True)
     try:
-        with open(toml_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                # Match: key = value # [unit] description
-                match = re.match(r'\s*(\w+)\s*=\s*(.+?)\s*#\s*(.+)', line)
-                if match:
-                    key = match.group(1)
-                    comment = match.group(3).strip()
-                    
-                    # Parse unit and description
-                    unit_match = re.match(r'\[(.+?)\]\s*(.*)', comment)
-                    if unit_match:
-                        unit = unit_match.group(1)
-                        description = unit_match.group(2)
-                    else:
-                        unit = ''
-                        description = comment
-                    
-                    comments[key] = {
-                        'unit': unit,
-                        'description': description
-                    }
-    except Exception as e:
-        print(f"Warning: Could not parse comments from {toml_path}: {e}")
-    
+        os.link(src, dst)
+    except FileExistsError:
+        # Another worker linked the same asset between our exists() check
+        # and the link; the destination is already in place
+        return
+    except OSError:
+        shutil.copy2(src, dst)
+
+def _mirror(src_dir, dst_dir):
+    """Mirror src_dir into dst_dir, touching only out-of-date files
+
+    Unlike rmtree + copytree this moves no bytes on a no-op build: files
+    whose mtime and size already match are left alone.
+    """
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    for root, dirs, files in os.walk(src_dir):
+        rel = Path(root).relative_to(src_dir)
+        for name in files:
+            src = Path(root) / name
+            dst = dst_dir / rel / name
+            if dst.exists():
+                if (dst.stat().st_mtime >= src.stat().st_mtime
+                        and dst.stat().st_size == src.stat().st_size):
+                    continue
+                dst.unlink()
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            _fast_copy(src, dst)
+
+def parse_toml_comments(toml_bytes):
+    """Extract unit and description from TOML comments
+
+    Takes the raw TOML source bytes (or any readable buffer such as an mmap)
+    and scans it in a single pass with the multiline bytes regex, decoding
+    only the matched groups.
+    """
+    comments = {}
+    for match in _KV_COMMENT_RE.finditer(toml_bytes):
+        key = match.group(1).decode('utf-8')
+        comment = match.group(3).decode('utf-8').strip()
+
+        # Parse unit and description
+        unit_match = _UNIT_RE.match(comment)
+        if unit_match:
+            unit = unit_match.group(1)
+            description = unit_match.group(2)
+        else:
+            unit = ''
+            description = comment
+
+        comments[key] = {
+            'unit': unit,
+            'description': description
+        }
+
     return comments
 
-def enrich_toml_data(data, comments, exclude_sections=None):
-    """Add unit and description info from comments to TOML data"""
+# Comment-extraction results keyed by path, storing (mtime_ns, comments);
+# an edit replaces the stale entry, so the cache stays bounded by the
+# number of distinct files rather than growing with every edit
+_comments_cache = {}
+
+def _parse_comments_cached(path_str, mtime_ns, toml_bytes):
+    """Memoized comment extraction keyed by path and mtime
+
+    Takes the already-read buffer so a cache miss costs no extra file open;
+    repeated invocations (watch mode, tests) skip re-scanning unchanged
+    files entirely.
+    """
+    cached = _comments_cache.get(path_str)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    comments = parse_toml_comments(toml_bytes)
+    _comments_cache[path_str] = (mtime_ns, comments)
+    return comments
+
+def _scan(toml_file):
+    """Read a TOML file once and extract structured data plus comments
+
+    Single I/O pass: the mmap'ed bytes feed both the TOML parser (for
+    values) and the comment scanner (for units and descriptions), so each
+    file is opened and walked once instead of twice.
+    """
+    mtime_ns = toml_file.stat().st_mtime_ns
+    with open(toml_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The bytes regex runs over the live mapping (zero-copy); only
+            # the TOML parser needs a decoded string
+            comments = _parse_comments_cached(str(toml_file), mtime_ns, mm)
+            data = tomli.loads(mm[:].decode('utf-8'))
+    return data, comments
+
+def enrich_toml_data(data, comments, exclude_sections=None, wrap_all_sections=None):
+    """Add unit and description info from comments to TOML data
+
+    Sections in wrap_all_sections get every key wrapped with metadata, even
+    when no comment exists for it (empty unit/description), so callers don't
+    need a second pass over them.
+    """
     if exclude_sections is None:
         exclude_sections = {'additional_checks'}
-    
+    if wrap_all_sections is None:
+        wrap_all_sections = set()
+
     for section_name in data:
         if section_name in exclude_sections:
             continue
         if isinstance(data[section_name], dict):
+            wrap_all = section_name in wrap_all_sections
             for key in list(data[section_name].keys()):
                 if key in comments:
                     # Wrap value with metadata
@@ -67,6 +228,13 @@ def enrich_toml_data(data, comments, exclude_sections=None):
                         'unit': comments[key]['unit'],
                         'description': comments[key]['description']
                     }
+                elif wrap_all:
+                    # Wrap with default metadata (e.g. params declared as "float")
+                    data[section_name][key] = {
+                        'value': data[section_name][key],
+                        'unit': '',
+                        'description': ''
+                    }
     return data
 
 def parse_check_formula(formula_str):
@@ -87,20 +255,16 @@ def parse_check_formula(formula_str):
     if not isinstance(formula_str, str):
         formula_str = str(formula_str)
     
-    # Find comparison operators (longer first)
-    operators = ['>=', '<=', '==', '!=', '>', '<']
-    
-    for op in operators:
-        if op in formula_str:
-            parts = formula_str.split(op, 1)
-            if len(parts) == 2:
-                return {
-                    'left': parts[0].strip(),
-                    'operator': op,
-                    'right': parts[1].strip(),
-                    'full': formula_str.strip()
-                }
-    
+    # Find the first comparison operator in a single scan
+    match = _OP_RE.search(formula_str)
+    if match:
+        return {
+            'left': formula_str[:match.start()].strip(),
+            'operator': match.group(1),
+            'right': formula_str[match.end():].strip(),
+            'full': formula_str.strip()
+        }
+
     # If no comparison found, treat whole thing as expression
     return {
         'left': formula_str.strip(),
@@ -109,158 +273,231 @@ def parse_check_formula(formula_str):
         'full': formula_str.strip()
     }
 
+def _init_worker_logging(level):
+    """Configure logging in a pool worker
+
+    Needed for the spawn and forkserver start methods, where workers don't
+    inherit the parent's logging configuration; without it the per-file
+    progress messages would be lost.
+    """
+    logging.basicConfig(level=level, format='%(message)s')
+
+def _process_one(toml_file, input_dir, output_dir, templates_dir, template_mtime=0.0,
+                 available_images=frozenset(), available_manuals=frozenset()):
+    """Parse, enrich and render a single TOML file
+
+    Designed to run in a worker process: takes only picklable arguments and
+    touches no shared state. Returns the index entry for the equipment list,
+    or None if processing failed.
+
+    Skips the rebuild when the output HTML is newer than both the TOML file
+    and the templates, reusing the index entry cached in a sidecar JSON.
+    """
+    input_path = Path(input_dir)
+    output_path = Path(output_dir)
+    images_output_path = output_path / 'images'
+    manuals_output_path = output_path / 'manuals'
+
+    html_file = output_path / f"{toml_file.stem}.html"
+    cache_file = _cache_dir(output_path) / f"{toml_file.stem}.json"
+    try:
+        if (html_file.exists() and cache_file.exists()
+                and html_file.stat().st_mtime > max(toml_file.stat().st_mtime, template_mtime)):
+            return json.loads(cache_file.read_bytes())
+    except Exception:
+        pass  # unreadable cache entry: fall through to a full rebuild
+
+    env = _get_env(str(templates_dir))
+    equipment_template = env.get_template('equipment.html')
+
+    try:
+        # Read the file once; data and comment metadata come from the same pass
+        raw_data, comments = _scan(toml_file)
+
+        # Enrich data with unit and description info (exclude additional_checks
+        # so checks remain raw strings); input_parameters are wrapped entirely
+        # so every entry is a mapping for the template
+        data = enrich_toml_data(
+            raw_data, comments,
+            exclude_sections={'additional_checks'},
+            wrap_all_sections={'input_parameters'}
+        )
+
+        # Parse additional checks to extract formulas (keep as structured dict)
+        additional_checks = {}
+        if 'additional_checks' in raw_data:
+            for check_name, formula in raw_data['additional_checks'].items():
+                parsed = parse_check_formula(formula)
+                # attach unit/description from parsed comments (if present)
+                parsed['unit'] = comments.get(check_name, {}).get('unit', '')
+                parsed['description'] = comments.get(check_name, {}).get('description', '')
+                additional_checks[check_name] = parsed
+
+        # Extract equipment info
+        shaker_info = data.get('shaker', {})
+        manufacturer = shaker_info.get('manufacturer', 'Unknown')
+        model = shaker_info.get('model', 'Unknown')
+        nominal_force = shaker_info.get('nominal_force', 'N/A')
+        title = f"{manufacturer} {model}"
+
+        # Copy associated manuals if they exist (membership in the
+        # pre-built set replaces a per-file stat)
+        if 'manual' in shaker_info:
+            manual = shaker_info['manual']
+            if manual in available_manuals:
+                src = input_path / 'manuals' / manual
+                dst = manuals_output_path / manual
+                _fast_copy(src, dst)
+                logger.info(f"✓ Copied manual: {manual}")
+
+        # We want additional_checks displayed immediately after input_parameters.
+        # Pass both equipment_data and additional_checks, and tell template which section to inject after.
+        # Stream the render directly into the file to avoid building the
+        # full HTML string in memory first.
+        with open(html_file, 'w', encoding='utf-8') as f:
+            equipment_template.stream(
+                title=title,
+                equipment_data=data,
+                additional_checks=additional_checks,
+                additional_checks_inject_after='input_parameters'
+            ).dump(f)
+
+        logger.info(f"✓ Generated: {html_file.name}")
+
+        # Copy associated images if they exist
+        for section_data in data.values():
+            if isinstance(section_data, dict) and 'image' in section_data:
+                image = section_data['image']
+                # Copy image file to output images directory if it exists
+                if image in available_images:
+                    src = input_path / 'images' / image
+                    dst = images_output_path / image
+                    dst.parent.mkdir(parents=True, exist_ok=True)
+                    _fast_copy(src, dst)
+                    logger.info(f"  ✓ Copied image: {image}")
+
+        # Return information for index; also cached alongside the HTML so
+        # skipped rebuilds can regenerate the index without reparsing
+        index_entry = {
+            'filename': f"{toml_file.stem}.html",
+            'title': title,
+            'manufacturer': manufacturer,
+            'model': model,
+            'nominal_force': f'{nominal_force["value"]} {nominal_force["unit"]}'
+        }
+        cache_file.write_bytes(json.dumps(index_entry).encode('utf-8'))
+        return index_entry
+
+    except Exception as e:
+        logger.error(f"✗ Error processing {toml_file.name}: {str(e)}")
+        return None
+
 def process_toml_files(input_dir, output_dir, templates_dir):
     """Process all TOML files in input_dir and generate static HTML files in output_dir"""
     input_path = Path(input_dir)
     output_path = Path(output_dir)
     templates_path = Path(templates_dir)
-    
-    # Setup Jinja2 environment
-    env = Environment(loader=FileSystemLoader(str(templates_path)), trim_blocks=True, lstrip_blocks=True)
-    equipment_template = env.get_template('equipment.html')
+
+    # Setup Jinja2 environment (cached across invocations)
+    env = _get_env(str(templates_path))
     index_template = env.get_template('index.html')
-    
+
     # Create output directory if it doesn't exist
     output_path.mkdir(parents=True, exist_ok=True)
-    
+
     # Create images directory in output
     images_output_path = output_path / 'images'
     images_output_path.mkdir(exist_ok=True)
-    
+
     # Create manuals directory in output
     manuals_output_path = output_path / 'manuals'
     manuals_output_path.mkdir(exist_ok=True)
 
+    # Create sidecar cache directory for index entries (kept out of the
+    # output tree so deploys of the generated site never ship it)
+    _cache_dir(output_path).mkdir(parents=True, exist_ok=True)
+
     # Copy static files (logo, etc.)
     static_input_path = templates_path / 'static'
     static_output_path = output_path / 'static'
     if static_input_path.exists():
-        if static_output_path.exists():
-            shutil.rmtree(static_output_path)
-        shutil.copytree(static_input_path, static_output_path)
-        print(f"✓ Copied static files to {static_output_path}")
+        _mirror(static_input_path, static_output_path)
+        logger.info(f"✓ Copied static files to {static_output_path}")
+
+    # Process TOML files in parallel; each file is independent so the work
+    # fans out across cores (tomli parse + regex scan + Jinja render are
+    # all CPU-bound)
+    # List input files with scandir (one getdents pass, no per-entry stat);
+    # DirEntry objects don't pickle, so hand the workers plain Paths
+    with os.scandir(input_path) as entries:
+        toml_files = sorted(
+            (Path(entry.path) for entry in entries
+             if entry.is_file() and entry.name.endswith('.toml')),
+            key=lambda p: p.name
+        )
+
+    # Templates feed into every page (including base.html, which both entry
+    # templates extend), so any template edit invalidates all of them
+    template_mtime = max(p.stat().st_mtime for p in templates_path.glob('*.html'))
+    # Index the asset directories once so the per-TOML existence checks
+    # become set lookups instead of stat syscalls
+    images_input_path = input_path / 'images'
+    manuals_input_path = input_path / 'manuals'
+    available_images = frozenset(os.listdir(images_input_path)) if images_input_path.is_dir() else frozenset()
+    available_manuals = frozenset(os.listdir(manuals_input_path)) if manuals_input_path.is_dir() else frozenset()
+
+    worker = functools.partial(
+        _process_one,
+        input_dir=input_dir,
+        output_dir=output_dir,
+        templates_dir=templates_dir,
+        template_mtime=template_mtime,
+        available_images=available_images,
+        available_manuals=available_manuals
+    )
+    with ProcessPoolExecutor(
+            initializer=_init_worker_logging,
+            initargs=(logging.getLogger().getEffectiveLevel(),)) as executor:
+        results = list(executor.map(worker, toml_files, chunksize=4))
+
+    # Collect index entries from the files that processed cleanly
+    equipment_list = [entry for entry in results if entry is not None]
 
-    # List to store equipment information for index
-    equipment_list = []
-    
-    # Process each TOML file
-    for toml_file in sorted(input_path.glob('*.toml')):
-        try:
-            # Read and parse TOML file
-            with open(toml_file, 'rb') as f:
-                raw_data = tomli.load(f)
-            
-            # Parse comments to extract units and descriptions
-            comments = parse_toml_comments(toml_file)
-            
-            # Enrich data with unit and description info (exclude additional_checks so checks remain raw strings)
-            data = enrich_toml_data(dict(raw_data), comments, exclude_sections={'additional_checks'})
-            
-            # Parse additional checks to extract formulas (keep as structured dict)
-            additional_checks = {}
-            if 'additional_checks' in raw_data:
-                for check_name, formula in raw_data['additional_checks'].items():
-                    parsed = parse_check_formula(formula)
-                    # attach unit/description from parsed comments (if present)
-                    parsed['unit'] = comments.get(check_name, {}).get('unit', '')
-                    parsed['description'] = comments.get(check_name, {}).get('description', '')
-                    additional_checks[check_name] = parsed
-            
-            # Ensure input_parameters are present as mapping (wrap simple declarations)
-            if 'input_parameters' in raw_data and isinstance(raw_data['input_parameters'], dict):
-                # For any input param that wasn't enriched (e.g. declared as string "float"), wrap it with metadata
-                for key, val in raw_data['input_parameters'].items():
-                    if key not in data.get('input_parameters', {}):
-                        unit = comments.get(key, {}).get('unit', '')
-                        desc = comments.get(key, {}).get('description', '')
-                        if 'input_parameters' not in data:
-                            data['input_parameters'] = {}
-                        data['input_parameters'][key] = {
-                            'value': val,
-                            'unit': unit,
-                            'description': desc
-                        }
-            
-            # Extract equipment info
-            shaker_info = data.get('shaker', {})
-            manufacturer = shaker_info.get('manufacturer', 'Unknown')
-            model = shaker_info.get('model', 'Unknown')
-            nominal_force = shaker_info.get('nominal_force', 'N/A')
-            title = f"{manufacturer} {model}"
-
-            # Copy associated manuals if they exist
-            manuals_input_path = input_path / 'manuals'
-            if manuals_input_path.exists() and manuals_input_path.is_dir():
-                if 'manual' in shaker_info:
-                    manual = shaker_info['manual']
-                    src = manuals_input_path / manual
-                    if src.exists():
-                        dst = manuals_output_path / manual
-                        shutil.copy2(src, dst)
-                        print(f"✓ Copied manual: {manual}")
-            
-            # Create HTML file name
-            html_file = output_path / f"{toml_file.stem}.html"
-            
-            # We want additional_checks displayed immediately after input_parameters.
-            # Pass both equipment_data and additional_checks, and tell template which section to inject after.
-            html_content = equipment_template.render(
-                title=title,
-                equipment_data=data,
-                additional_checks=additional_checks,
-                additional_checks_inject_after='input_parameters'
-            )
-            
-            # Write HTML file
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            print(f"✓ Generated: {html_file.name}")
-            
-            # Copy associated images if they exist
-            images_input_path = input_path / 'images'
-            if images_input_path.exists():
-                for section_data in data.values():
-                    if isinstance(section_data, dict) and 'image' in section_data:
-                        image = section_data['image']
-                        # Copy image file to output images directory if it exists
-                        src = images_input_path / image
-                        if src.exists():
-                            dst = images_output_path / image
-                            dst.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(src, dst)
-                            print(f"  ✓ Copied image: {image}")
-            
-            # Store information for index
-            equipment_list.append({
-                'filename': f"{toml_file.stem}.html",
-                'title': title,
-                'manufacturer': manufacturer,
-                'model': model,
-                'nominal_force': f'{nominal_force["value"]} {nominal_force["unit"]}'
-            })
-            
-        except Exception as e:
-            print(f"✗ Error processing {toml_file.name}: {str(e)}")
-    
     # Generate index.html
     if equipment_list:
         # Sort equipment list by manufacturer and model
         equipment_list.sort(key=lambda x: (x['manufacturer'], x['model']))
         
         # Render index template
-        index_content = index_template.render(
-            equipment_items=equipment_list,
-            generated_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        )
-        
+        generated_date = time.strftime('%Y-%m-%d %H:%M:%S')
         index_path = output_path / 'index.html'
         with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(index_content)
+            index_template.stream(
+                equipment_items=equipment_list,
+                generated_date=generated_date
+            ).dump(f)
         
-        print(f"✓ Generated: index.html with {len(equipment_list)} entries")
+        logger.info(f"✓ Generated: index.html with {len(equipment_list)} entries")
     else:
-        print("✗ No TOML files found to process")
+        logger.warning("✗ No TOML files found to process")
 
 if __name__ == "__main__":
-    process_toml_files("input", "docs", "templates")
+    parser = argparse.ArgumentParser(
+        description="Generate static HTML documentation from TOML equipment files"
+    )
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='log per-file progress (default: warnings only)')
+    parser.add_argument('--compile-templates', action='store_true',
+                        help='ahead-of-time compile the templates and exit')
+    args = parser.parse_args()
+
+    # Pool workers get the same level through _init_worker_logging
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(message)s'
+    )
+    if args.compile_templates:
+        target = compile_templates("templates")
+        logger.info(f"✓ Compiled templates to {target}")
+    else:
+        process_toml_files("input", "docs", "templates")